@@ -2,10 +2,64 @@ import pyaudio
 import numpy as np
 import time
 import threading
-import subprocess
 import os
+import sys
+import select
+import signal
+import atexit
+import shutil
+import queue
+from collections import deque
+from math import floor, log10, sqrt
+
+# Shared /dev/null for silencing helper processes, opened once per run
+_DEVNULL = open(os.devnull, 'wb')
+atexit.register(_DEVNULL.close)
+
+def _sum_of_squares(audio_data):
+    """Return the exact integer sum of squares of an int64 array of samples."""
+    # Single fused multiply-accumulate; int64 so the sum can't overflow
+    return int(np.dot(audio_data, audio_data))
+
+def _mean_square_to_db(square_sum):
+    """Convert a mean square sample value to a positive dB level."""
+    if square_sum <= 0:
+        return 0  # Return zero dB for silent input
+
+    # Clamp before the sqrt: rms < 1 exactly when square_sum < 1
+    rms = sqrt(max(square_sum, 1.0))
+
+    # Convert to dB
+    # Using reference of 1 as the maximum value for int16 (32767)
+    db = 20 * log10(rms / 32767.0)
+
+    # dB values will be negative (since reference is max value)
+    # Convert to positive scale for easier understanding
+    db_positive = 96 + db  # Adding 96 makes typical quiet room ~30-40dB
+
+    return max(0, db_positive)  # Prevent negative values
+
+def _windowed_db(samples, window):
+    """Positive dB level of each consecutive `window`-sample block of int16 samples."""
+    n_windows = len(samples) // window
+    blocks = samples[:n_windows * window].reshape(n_windows, window).astype(np.int64)
+    # Per-window mean square in one vectorized pass
+    square_sums = np.einsum('ij,ij->i', blocks, blocks) / window
+    square_sums = square_sums[square_sums > 0]  # Skip silent windows
+
+    rms = np.sqrt(square_sums)
+    np.maximum(rms, 1.0, out=rms)  # Branchless clamp, in place
+    db_positive = 96 + 20 * np.log10(rms / 32767)
+    return db_positive[db_positive > 0]
+
+def _db_to_mean_square(db):
+    """Inverse of _mean_square_to_db: the mean square that reads as `db`."""
+    return (32767 * 10 ** ((db - 96) / 20)) ** 2
 
 class SoundLevelAlarm:
+    # Print the current level on every Nth measurement only
+    _display_every = 4
+
     def __init__(self, threshold_db=70, sample_rate=44100, chunk_size=1024, 
                  update_interval=0.5, alarm_duration=1.0, input_device=None, output_device=None,
                  cooldown_time=3.0):
@@ -34,8 +88,36 @@ class SoundLevelAlarm:
         self.p = pyaudio.PyAudio()
         self.stream = None
         self.running = False
-        self.current_db = 0
+        # Latest (sum of squares, sample count); current_db converts it to dB when read
+        self._last_measurement = (0, 0)
         self.last_alarm_time = 0
+        # Each measurement covers all the audio captured in one update interval
+        self._chunks_per_measurement = max(1, round(sample_rate * update_interval / chunk_size))
+        # Reused on every measurement to avoid per-read allocations
+        self._scratch = np.empty(self._chunks_per_measurement * chunk_size, dtype=np.int64)
+        # Threshold as an integer per-measurement sum of squares, so the hot
+        # loop does a single int comparison with no division or log10
+        self._threshold_ss = self._threshold_sum_of_squares(threshold_db)
+        # Ring of captured chunks filled by the PortAudio callback (at least ~1 second);
+        # the oldest chunk is dropped when the reader falls behind
+        self._frames = deque(maxlen=max(sample_rate // chunk_size, 2 * self._chunks_per_measurement))
+        self._frames_ready = threading.Event()
+        # While calibrating, the callback also copies every chunk into this list
+        self._calibration_tap = None
+        # Messages from the monitoring thread, printed by a separate logger thread
+        self._log_q = queue.SimpleQueue()
+        self._log_thread = None
+        # Pids of alarm players that have not been reaped yet
+        self._alarm_pids = []
+        # In-process alarm tone, used when paplay is not installed
+        self._out_stream = None
+        self._alarm_frames = None
+        self._tone_q = None
+        self._tone_thread = None
+        # Set while a tone is queued or playing, so alarms can't pile up
+        self._tone_pending = threading.Event()
+        # Pick the alarm player once instead of probing on every alarm
+        self._alarm_backend, self._alarm_cmd = self._select_alarm_command()
         
     def start_monitoring(self):
         """Start monitoring sound levels."""
@@ -47,9 +129,15 @@ class SoundLevelAlarm:
                 rate=self.sample_rate,
                 input=True,
                 input_device_index=self.input_device,
-                frames_per_buffer=self.chunk_size
+                frames_per_buffer=self.chunk_size,
+                stream_callback=self._audio_callback
             )
             
+            # Print status messages off the monitoring thread
+            self._log_thread = threading.Thread(target=self._log_loop)
+            self._log_thread.daemon = True
+            self._log_thread.start()
+
             # Start monitoring in a separate thread
             monitor_thread = threading.Thread(target=self._monitor_loop)
             monitor_thread.daemon = True
@@ -65,75 +153,215 @@ class SoundLevelAlarm:
         
     def _monitor_loop(self):
         """Main monitoring loop."""
+        iteration = 0
+        # No sleep: _read_samples blocks until a full interval of audio has
+        # been captured, so the audio clock paces the loop without drift
         while self.running:
-            self.current_db = self._get_db_level()
-            print(f"Current sound level: {self.current_db:.1f} dB")
+            sum_sq, n_samples = self._get_sum_of_squares()
+            self._last_measurement = (sum_sq, n_samples)
+            exceeded = sum_sq > self._threshold_ss
+            display = iteration % self._display_every == 0
+            iteration += 1
+
+            if display:
+                self._log(f"Current sound level: {self.current_db:.1f} dB")
             
             current_time = time.time()
             time_since_last_alarm = current_time - self.last_alarm_time
             
-            if self.current_db > self.threshold_db and time_since_last_alarm > self.cooldown_time:
-                print(f"ALARM! Sound level ({self.current_db:.1f} dB) exceeded threshold ({self.threshold_db} dB)")
+            if exceeded and time_since_last_alarm > self.cooldown_time:
+                self._log(f"ALARM! Sound level ({self.current_db:.1f} dB) exceeded threshold ({self.threshold_db} dB)")
                 self._trigger_alarm()
                 self.last_alarm_time = current_time
-                
-            time.sleep(self.update_interval)
     
-    def _get_db_level(self):
-        """Measure current dB level."""
+    @property
+    def current_db(self):
+        """Most recent sound level in dB, converted from the last measurement on read."""
+        sum_sq, n_samples = self._last_measurement
+        if not n_samples:
+            return 0
+        return _mean_square_to_db(sum_sq / n_samples)
+
+    def _log(self, message):
+        """Queue a message for the logger thread instead of printing inline."""
+        self._log_q.put_nowait(message)
+
+    def _log_loop(self):
+        """Print queued messages until a None sentinel is received."""
+        while True:
+            message = self._log_q.get()
+            if message is None:
+                break
+            print(message)
+
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: hand captured audio to the monitoring thread."""
+        self._frames.append(in_data)
+        self._frames_ready.set()
+        tap = self._calibration_tap
+        if tap is not None:
+            tap.append(in_data)
+        return (None, pyaudio.paContinue)
+
+    def _read_chunk(self, timeout=1.0):
+        """Pop the oldest captured chunk, waiting for the callback if needed."""
+        while True:
+            # Clear before checking so a chunk appended in between still wakes us
+            self._frames_ready.clear()
+            try:
+                return self._frames.popleft()
+            except IndexError:
+                pass
+            if not self._frames_ready.wait(timeout):
+                raise TimeoutError("no audio received from input device")
+
+    def _read_samples(self):
+        """Gather one update interval's worth of chunks into the sample buffer."""
+        pos = 0
+        for _ in range(self._chunks_per_measurement):
+            samples = np.frombuffer(self._read_chunk(), dtype=np.int16)
+            self._scratch[pos:pos + len(samples)] = samples
+            pos += len(samples)
+        return self._scratch[:pos]
+
+    def _get_sum_of_squares(self):
+        """Measure the sum of squared samples over one update interval.
+
+        Returns (sum of squares, number of samples measured).
+        """
         try:
             # Read audio data
-            data = self.stream.read(self.chunk_size, exception_on_overflow=False)
-            # Convert to numpy array
-            audio_data = np.frombuffer(data, dtype=np.int16)
-            
-            # Compute RMS value with error handling
-            # Add small epsilon to prevent invalid value in sqrt
-            square_sum = np.mean(np.square(audio_data))
-            if square_sum <= 0:
-                return 0  # Return zero dB for silent input
-                
-            rms = np.sqrt(square_sum)
-                
-            # Convert to dB
-            # Using reference of 1 as the maximum value for int16 (32767)
-            db = 20 * np.log10(max(rms, 1) / 32767)
-            
-            # dB values will be negative (since reference is max value)
-            # Convert to positive scale for easier understanding
-            db_positive = 96 + db  # Adding 96 makes typical quiet room ~30-40dB
-            
-            return max(0, db_positive)  # Prevent negative values
+            samples = self._read_samples()
+            return _sum_of_squares(samples), samples.size
         except Exception as e:
-            print(f"Error measuring sound level: {e}")
+            self._log(f"Error measuring sound level: {e}")
+            return 0, 0
+
+    def _threshold_sum_of_squares(self, threshold_db):
+        """Integer sum of squares over one measurement that corresponds to `threshold_db`.
+
+        An alarm fires when the measured sum is strictly greater than this value,
+        which matches comparing the dB level against `threshold_db`.
+        """
+        n = self._scratch.size
+        if not threshold_db < _mean_square_to_db(32768 ** 2):
+            # At or above the loudest possible reading (also inf/nan): never alarm
+            return 32768 ** 2 * n
+        if threshold_db < 0:
+            # Every reading, even silence (0 dB), is above the threshold
+            return -1
+        if threshold_db < _mean_square_to_db(1):
+            # Any non-silent input reads at least the ~5.7 dB clamp floor
             return 0
+        # For an integer sum, sum > x exactly when sum > floor(x)
+        return floor(_db_to_mean_square(threshold_db) * n)
     
-    def _trigger_alarm(self):
-        """Trigger the alarm sound for Linux systems."""
-        try:
-            # First try using paplay (PulseAudio) with device selection
-            cmd = ['paplay', '--volume=65536']
-            
+    def _select_alarm_command(self):
+        """Choose the alarm backend ('paplay', 'tone', 'sox' or 'bell') and build its command."""
+        paplay_path = shutil.which('paplay')
+        if paplay_path:
+            # PulseAudio with device selection
+            cmd = [paplay_path, '--volume=65536']
+
             # Add output device parameter if specified
             if self.output_device is not None:
                 device_name = self.get_pulse_device_name(self.output_device)
                 if device_name:
                     cmd.extend(['-d', device_name])
-            
+
             cmd.append('/usr/share/sounds/freedesktop/stereo/alarm-clock-elapsed.oga')
-            
-            subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except:
+            return 'paplay', cmd
+        if self._open_tone_output():
+            # Play a precomputed sine tone through PyAudio
+            return 'tone', None
+        play_path = shutil.which('play')
+        if play_path:
+            # SoX if paplay is not available
+            return 'sox', [play_path, '-q', '-n', 'synth', str(self.alarm_duration),
+                           'sine', '1000', 'vol', '0.7']
+        # Console bell if nothing else is available
+        return 'bell', None
+
+    def _open_tone_output(self):
+        """Precompute the 1 kHz alarm tone and open an output stream for it."""
+        n_samples = int(self.sample_rate * self.alarm_duration)
+        t = np.arange(n_samples, dtype=np.float32) / self.sample_rate
+        tone = (0.7 * np.sin(2 * np.pi * 1000.0 * t)).astype(np.float32)
+        try:
+            self._out_stream = self.p.open(
+                format=pyaudio.paFloat32,
+                channels=1,
+                rate=self.sample_rate,
+                output=True,
+                output_device_index=self.output_device,
+                start=False  # Only run the stream (and hold the device) while a tone plays
+            )
+        except Exception:
+            return False
+        self._alarm_frames = tone.tobytes()
+
+        # Blocking writes happen on a dedicated worker thread
+        self._tone_q = queue.SimpleQueue()
+        self._tone_thread = threading.Thread(target=self._tone_loop, args=(self._tone_q,))
+        self._tone_thread.daemon = True
+        self._tone_thread.start()
+        return True
+
+    def _tone_loop(self, tone_q):
+        """Play the alarm tone once per request until a None sentinel is received."""
+        while tone_q.get() is not None:
+            if not self.running:
+                self._tone_pending.clear()
+                continue  # Skip requests still queued when monitoring stopped
+            try:
+                self._out_stream.start_stream()
+                self._out_stream.write(self._alarm_frames)
+                self._out_stream.stop_stream()
+            except Exception as e:
+                self._log(f"Error playing alarm tone: {e}")
+            finally:
+                self._tone_pending.clear()
+
+    def _trigger_alarm(self):
+        """Trigger the alarm sound for Linux systems without waiting for playback."""
+        if self._alarm_backend == 'tone':
+            tone_q = self._tone_q
+            # None once monitoring has stopped; skip if a tone is already due
+            if tone_q is not None and not self._tone_pending.is_set():
+                self._tone_pending.set()
+                tone_q.put_nowait(True)
+            return
+        if self._alarm_backend in ('paplay', 'sox'):
+            self._reap_alarm_players()
             try:
-                # Try using SoX if paplay is not available
-                subprocess.call(['play', '-q', '-n', 'synth', str(self.alarm_duration), 
-                               'sine', '1000', 'vol', '0.7'],
-                               stdout=subprocess.DEVNULL, 
-                               stderr=subprocess.DEVNULL)
+                # posix_spawn avoids the fork+exec cost of subprocess
+                pid = os.posix_spawn(
+                    self._alarm_cmd[0], self._alarm_cmd, os.environ,
+                    file_actions=[
+                        (os.POSIX_SPAWN_DUP2, _DEVNULL.fileno(), 1),
+                        (os.POSIX_SPAWN_DUP2, _DEVNULL.fileno(), 2),
+                    ],
+                    # Undo Python's SIG_IGN, as subprocess's restore_signals does
+                    setsigdef=(signal.SIGPIPE, signal.SIGXFSZ))
+                self._alarm_pids.append(pid)
+                return
             except:
-                # Fall back to console bell if neither method works
-                print('\a')
+                pass
+        # Fall back to console bell if the player could not be started
+        self._log('\a')
     
+    def _reap_alarm_players(self):
+        """Wait on every finished alarm player so none is left as a zombie."""
+        still_running = []
+        for pid in self._alarm_pids:
+            try:
+                done, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                continue  # Already reaped elsewhere
+            if not done:
+                still_running.append(pid)
+        self._alarm_pids = still_running
+
     def get_pulse_device_name(self, device_index):
         """Convert PyAudio device index to PulseAudio device name"""
         try:
@@ -148,12 +376,27 @@ class SoundLevelAlarm:
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
+        if self._tone_q is not None:
+            self._tone_q.put_nowait(None)
+            self._tone_q = None
+            # Let a tone that is playing finish before its stream is closed
+            self._tone_thread.join(timeout=self.alarm_duration + 1.0)
+            self._out_stream.close()
+            self._out_stream = None
         self.p.terminate()
+        self._reap_alarm_players()
+        if self._log_thread:
+            # Flush any pending messages before reporting the stop
+            self._log_q.put_nowait(None)
+            self._log_thread.join(timeout=1.0)
         print("Monitoring stopped.")
     
     def set_threshold(self, new_threshold):
         """Change the dB threshold."""
+        # Convert first so a failure can't leave the two values out of sync
+        threshold_ss = self._threshold_sum_of_squares(new_threshold)
         self.threshold_db = new_threshold
+        self._threshold_ss = threshold_ss
         print(f"Threshold updated to {self.threshold_db} dB")
         
     def set_cooldown(self, new_cooldown):
@@ -168,20 +411,30 @@ class SoundLevelAlarm:
             return None
             
         print(f"Measuring ambient noise for {duration} seconds...")
-        start_time = time.time()
-        db_values = []
+        n_windows = max(1, int(duration * self.sample_rate) // self.chunk_size)
         
-        while time.time() - start_time < duration:
-            db = self._get_db_level()
-            if db > 0:  # Filter out error readings
-                db_values.append(db)
+        # Record the whole period continuously, alongside the monitoring thread
+        chunks = []
+        self._calibration_tap = chunks
+        deadline = time.monotonic() + duration + 1.0
+        while len(chunks) < n_windows and time.monotonic() < deadline:
             time.sleep(0.1)
+        self._calibration_tap = None
         
-        if not db_values:
+        buf = np.empty(n_windows * self.chunk_size, dtype=np.int16)
+        idx = 0
+        for data in chunks[:n_windows]:
+            samples = np.frombuffer(data, dtype=np.int16)
+            buf[idx:idx + len(samples)] = samples
+            idx += len(samples)
+        
+        # dB level of every chunk-sized window, computed in one pass
+        db_values = _windowed_db(buf[:idx], self.chunk_size)
+        if not len(db_values):
             print("Error: Could not measure ambient noise")
             return None
             
-        avg_db = sum(db_values) / len(db_values)
+        avg_db = float(db_values.mean())
         print(f"Ambient noise level: {avg_db:.1f} dB")
         return avg_db
 
@@ -193,53 +446,73 @@ def list_audio_devices():
     print("ID\tInput/Output\tDevice Name")
     print("-" * 50)
     
-    input_devices = []
-    output_devices = []
+    infos = [p.get_device_info_by_index(i) for i in range(p.get_device_count())]
     
-    for i in range(p.get_device_count()):
-        device_info = p.get_device_info_by_index(i)
-        name = device_info.get('name')
-        
-        # Check if it's an input device
-        if device_info.get('maxInputChannels') > 0:
-            input_devices.append((i, name))
-            print(f"{i}\tInput\t\t{name}")
-        
-        # Check if it's an output device
-        if device_info.get('maxOutputChannels') > 0:
-            output_devices.append((i, name))
-            print(f"{i}\tOutput\t\t{name}")
+    # Devices with input channels, then devices with output channels
+    input_devices = [(i, d.get('name')) for i, d in enumerate(infos) if d.get('maxInputChannels') > 0]
+    output_devices = [(i, d.get('name')) for i, d in enumerate(infos) if d.get('maxOutputChannels') > 0]
+    
+    # Build the whole table and print it in one write
+    lines = []
+    for i, d in enumerate(infos):
+        if d.get('maxInputChannels') > 0:
+            lines.append(f"{i}\tInput\t\t{d.get('name')}")
+        if d.get('maxOutputChannels') > 0:
+            lines.append(f"{i}\tOutput\t\t{d.get('name')}")
+    if lines:
+        print("\n".join(lines))
     
     p.terminate()
     print("-" * 50)
     
     return input_devices, output_devices
 
+_stdin_pending = bytearray()
+
+def _input(prompt=""):
+    """input() replacement that polls stdin with select and splits lines itself.
+
+    Reading the file descriptor directly means several lines arriving at once
+    (e.g. from a pipe) are all seen, instead of sitting unnoticed in sys.stdin's
+    buffer while select reports nothing new.
+    """
+    print(prompt, end="", flush=True)
+    while b"\n" not in _stdin_pending:
+        # Poll so the main thread wakes up regularly and never sits in a long read
+        ready, _, _ = select.select([sys.stdin], [], [], 0.1)
+        if not ready:
+            continue
+        data = os.read(sys.stdin.fileno(), 4096)
+        if not data:  # EOF
+            if not _stdin_pending:
+                raise EOFError
+            data = b"\n"  # Terminate the final partial line
+        _stdin_pending.extend(data)
+    end = _stdin_pending.index(b"\n")
+    line = _stdin_pending[:end].decode(sys.stdin.encoding or "utf-8", errors="replace")
+    del _stdin_pending[:end + 1]
+    # Accept CRLF line endings, as input()'s universal newlines did
+    return line[:-1] if line.endswith("\r") else line
+
 # Example usage
 if __name__ == "__main__":
     # Check for necessary packages
     missing_packages = []
     
-    # Try to check for PulseAudio
-    try:
-        subprocess.call(['paplay', '--version'], 
-                       stdout=subprocess.DEVNULL, 
-                       stderr=subprocess.DEVNULL)
-    except:
+    # Same lookups SoundLevelAlarm uses to pick its alarm backend
+    has_paplay = shutil.which('paplay') is not None
+    if not has_paplay:
         missing_packages.append("pulseaudio or pulseaudio-utils")
-    
-    # Try to check for SoX
-    try:
-        subprocess.call(['play', '--version'], 
-                       stdout=subprocess.DEVNULL, 
-                       stderr=subprocess.DEVNULL)
-    except:
+    if not shutil.which('play'):
         missing_packages.append("sox")
     
     if missing_packages:
         print("Note: For best alarm sounds, consider installing these packages:")
         print("sudo apt-get install " + " ".join(missing_packages))
-        print("Continuing with console bell as fallback...\n")
+        if not has_paplay:
+            print("Continuing with a generated 1 kHz tone as fallback "
+                  "(SoX or the console bell if no output stream can be opened)...")
+        print()
     
     # List available devices
     input_devices, output_devices = list_audio_devices()
@@ -251,7 +524,7 @@ if __name__ == "__main__":
     # Allow user to select input device
     if input_devices:
         try:
-            select_input = input("\nSelect input device ID (or press Enter for default): ").strip()
+            select_input = _input("\nSelect input device ID (or press Enter for default): ").strip()
             if select_input:
                 selected_input = int(select_input)
                 print(f"Selected input device: {next((name for id, name in input_devices if id == selected_input), 'Unknown')}")
@@ -261,7 +534,7 @@ if __name__ == "__main__":
     # Allow user to select output device
     if output_devices:
         try:
-            select_output = input("Select output device ID (or press Enter for default): ").strip()
+            select_output = _input("Select output device ID (or press Enter for default): ").strip()
             if select_output:
                 selected_output = int(select_output)
                 print(f"Selected output device: {next((name for id, name in output_devices if id == selected_output), 'Unknown')}")
@@ -270,7 +543,7 @@ if __name__ == "__main__":
     
     # Set threshold
     try:
-        threshold_input = input("Enter dB threshold (or press Enter for default 70dB): ").strip()
+        threshold_input = _input("Enter dB threshold (or press Enter for default 70dB): ").strip()
         threshold = float(threshold_input) if threshold_input else 70
     except ValueError:
         print("Invalid threshold value, using default 70dB")
@@ -278,7 +551,7 @@ if __name__ == "__main__":
         
     # Set cooldown time
     try:
-        cooldown_input = input("Enter cooldown time between alarms in seconds (or press Enter for default 3s): ").strip()
+        cooldown_input = _input("Enter cooldown time between alarms in seconds (or press Enter for default 3s): ").strip()
         cooldown = float(cooldown_input) if cooldown_input else 3.0
     except ValueError:
         print("Invalid cooldown value, using default 3 seconds")
@@ -300,12 +573,12 @@ if __name__ == "__main__":
             exit(1)
             
         # Option to calibrate based on ambient noise
-        calibrate = input("Would you like to calibrate based on the ambient noise? (y/n): ").lower().strip()
+        calibrate = _input("Would you like to calibrate based on the ambient noise? (y/n): ").lower().strip()
         if calibrate == 'y':
             ambient_db = alarm.calculate_ambient_noise(5.0)
             if ambient_db:
                 suggested_threshold = ambient_db + 10
-                set_to_suggested = input(f"Set threshold to {suggested_threshold:.1f} dB? (y/n): ").lower().strip()
+                set_to_suggested = _input(f"Set threshold to {suggested_threshold:.1f} dB? (y/n): ").lower().strip()
                 if set_to_suggested == 'y':
                     alarm.set_threshold(suggested_threshold)
         
@@ -317,7 +590,10 @@ if __name__ == "__main__":
         print("  a - Measure ambient noise and suggest threshold")
         
         while True:
-            command = input("\nEnter command: ")
+            try:
+                command = _input("\nEnter command: ")
+            except EOFError:
+                break
             if command.lower() == 'q':
                 break
             elif command.lower().startswith('t'):
@@ -337,7 +613,7 @@ if __name__ == "__main__":
                 if ambient_db:
                     suggested_threshold = ambient_db + 10
                     print(f"Suggested threshold: {suggested_threshold:.1f} dB")
-                    set_to_suggested = input(f"Set threshold to {suggested_threshold:.1f} dB? (y/n): ").lower().strip()
+                    set_to_suggested = _input(f"Set threshold to {suggested_threshold:.1f} dB? (y/n): ").lower().strip()
                     if set_to_suggested == 'y':
                         alarm.set_threshold(suggested_threshold)
     